@@ -6,6 +6,7 @@ Mapping from types/oids to Dumpers/Loaders
 
 from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 from typing import cast, TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 from . import pq
 from . import errors as e
@@ -60,12 +61,19 @@ class AdaptersMap:
     types: TypesRegistry
 
     _dumpers: Dict[PyFormat, Dict[Union[type, str], Type[Dumper]]]
+    # Dumpers found for subclasses. Weak keys, as this is usually the global
+    # map cache, to avoid keeping dynamically created classes alive.
+    _dumpers_mro: Dict[PyFormat, "WeakKeyDictionary[type, Type[Dumper]]"]
     _dumpers_by_oid: List[Dict[int, Type[Dumper]]]
     _loaders: List[Dict[int, Type[Loader]]]
 
     # Record if a dumper or loader has an optimised version.
     _optimised: Dict[type, type] = {}
 
+    # Increased on every registration: objects caching the adapters found
+    # (e.g. a Transformer reused by a cursor) can detect that they are stale.
+    _generation: int = 0
+
     def __init__(
         self,
         template: Optional["AdaptersMap"] = None,
@@ -75,6 +83,7 @@ class AdaptersMap:
             self._dumpers = template._dumpers.copy()
             self._own_dumpers = _dumpers_shared.copy()
             template._own_dumpers = _dumpers_shared.copy()
+            self._dumpers_mro = template._dumpers_mro.copy()
 
             self._dumpers_by_oid = template._dumpers_by_oid[:]
             self._own_dumpers_by_oid = [False, False]
@@ -89,6 +98,7 @@ class AdaptersMap:
         else:
             self._dumpers = {fmt: {} for fmt in PyFormat}
             self._own_dumpers = _dumpers_owned.copy()
+            self._dumpers_mro = {fmt: WeakKeyDictionary() for fmt in PyFormat}
 
             self._dumpers_by_oid = [{}, {}]
             self._own_dumpers_by_oid = [True, True]
@@ -150,6 +160,11 @@ class AdaptersMap:
 
                 self._dumpers[fmt][cls] = dumper
 
+                # Forget the dumpers found looking at the classes MRO: the
+                # dumper registered might change the result. Don't clear the
+                # dict, as it might be shared with other maps.
+                self._dumpers_mro[fmt] = WeakKeyDictionary()
+
         # Register the dumper by oid, if the oid of the dumper is fixed
         if dumper.oid:
             if not self._own_dumpers_by_oid[dumper.format]:
@@ -160,6 +175,8 @@ class AdaptersMap:
 
             self._dumpers_by_oid[dumper.format][dumper.oid] = dumper
 
+        self._generation += 1
+
     def register_loader(self, oid: Union[int, str], loader: Type["Loader"]) -> None:
         """
         Configure the context to use `!loader` to convert data of oid `!oid`.
@@ -171,10 +188,13 @@ class AdaptersMap:
         looked up in the `types` registry. `
 
         """
-        if isinstance(oid, str):
-            oid = self.types[oid].oid
         if not isinstance(oid, int):
-            raise TypeError(f"loaders should be registered on oid, got {oid} instead")
+            if isinstance(oid, str):
+                oid = self.types[oid].oid
+            else:
+                raise TypeError(
+                    f"loaders should be registered on oid, got {oid} instead"
+                )
 
         if _psycopg:
             loader = self._get_optimised(loader)
@@ -185,6 +205,7 @@ class AdaptersMap:
             self._own_loaders[fmt] = True
 
         self._loaders[fmt][oid] = loader
+        self._generation += 1
 
     def get_dumper(self, cls: type, format: PyFormat) -> Type["Dumper"]:
         """
@@ -207,16 +228,24 @@ class AdaptersMap:
             # look for different cases.
             dmap = self._dumpers[format]
 
+        # Check if the class was already looked up.
+        found = self._dumpers_mro[format]
+        d = found.get(cls)
+        if d:
+            return d
+
         # Look for the right class, including looking at superclasses
         for scls in cls.__mro__:
-            if scls in dmap:
-                return dmap[scls]
+            d = dmap.get(scls)
+            if d:
+                found[cls] = d
+                return d
 
             # If the adapter is not found, look for its name as a string
             fqn = scls.__module__ + "." + scls.__qualname__
             if fqn in dmap:
                 # Replace the class name with the class itself
-                d = dmap[scls] = dmap.pop(fqn)
+                d = found[cls] = dmap[scls] = dmap.pop(fqn)
                 return d
 
         format = PyFormat(format)
@@ -234,24 +263,24 @@ class AdaptersMap:
         :param oid: The oid of the type to dump to.
         :param format: The format to dump to.
         """
-        try:
-            dmap = self._dumpers_by_oid[format]
-        except KeyError:
+        if not isinstance(format, int) or format not in (0, 1):
             raise ValueError(f"bad dumper format: {format}")
+        dmap = self._dumpers_by_oid[format]
 
         try:
             return dmap[oid]
         except KeyError:
+            fname = pq.Format(format).name
             info = self.types.get(oid)
             if info:
                 msg = (
                     f"cannot find a dumper for type {info.name} (oid {oid})"
-                    f" format {pq.Format(format).name}"
+                    f" format {fname}"
                 )
             else:
                 msg = (
                     f"cannot find a dumper for unknown type with oid {oid}"
-                    f" format {pq.Format(format).name}"
+                    f" format {fname}"
                 )
             raise e.ProgrammingError(msg)
 
@@ -264,6 +293,8 @@ class AdaptersMap:
         :param oid: The oid of the type to load.
         :param format: The format to load from.
         """
+        if not isinstance(format, int) or format not in (0, 1):
+            raise ValueError(f"bad loader format: {format}")
         return self._loaders[format].get(oid)
 
     @classmethod
@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from .connection import BaseConnection
 
 DumperCache: TypeAlias = Dict[DumperKey, abc.Dumper]
+ParamDumper: TypeAlias = Tuple[type, PyFormat, abc.Dumper, bool]
 OidDumperCache: TypeAlias = Dict[int, abc.Dumper]
 LoaderCache: TypeAlias = Dict[int, abc.Loader]
 
@@ -49,35 +50,54 @@ class Transformer(AdaptContext):
     __module__ = "psycopg.adapt"
 
     __slots__ = """
-        types formats
-        _conn _adapters _pgresult _dumpers _loaders _encoding _none_oid
-        _oid_dumpers _oid_types _row_dumpers _row_loaders
+        types formats connection
+        _adapters _pgresult _dumpers _loaders _encoding _none_oid
+        _oid_dumpers _oid_types _row_dumpers _row_loaders _nfields _ntuples
+        _last_key _last_format _last_dumper _params_dumpers
         """.split()
 
     types: Optional[Tuple[int, ...]]
     formats: Optional[List[pq.Format]]
 
+    # Plain attribute rather than a property: it is read every time a Dumper
+    # or Loader is created with this object as context. It is read-only in
+    # the C implementation: don't assign it outside __init__().
+    connection: Optional["BaseConnection[Any]"]
+
     _adapters: "AdaptersMap"
     _pgresult: Optional["PGresult"]
     _none_oid: int
+    _last_dumper: abc.Dumper
 
     def __init__(self, context: Optional[AdaptContext] = None):
         self._pgresult = self.types = self.formats = None
 
         # WARNING: don't store context, or you'll create a loop with the Cursor
-        if context:
+        if context is not None:
             self._adapters = context.adapters
-            self._conn = context.connection
+            self.connection = context.connection
         else:
             from . import postgres
 
             self._adapters = postgres.adapters
-            self._conn = None
+            self.connection = None
 
         # mapping fmt, class -> Dumper instance
         self._dumpers: DefaultDict[PyFormat, DumperCache]
         self._dumpers = defaultdict(dict)
 
+        # type and format requested in the last get_dumper() call, and the
+        # Dumper instance found for them (before any upgrade). The same type is
+        # often dumped many times in a row, so this can save a cache lookup.
+        self._last_key: Optional[type] = None
+        self._last_format: Optional[PyFormat] = None
+
+        # type, format, Dumper instance (before any upgrade) used for each
+        # parameter in the last dump_sequence() call, and whether the dumper
+        # may need an upgrade. executemany() dumps many sequences with the same
+        # types, so the dumpers can be reused.
+        self._params_dumpers: List[Optional[ParamDumper]] = []
+
         # mapping fmt, oid -> Dumper instance
         # Not often used, so create it only if needed.
         self._oid_dumpers: Optional[Tuple[OidDumperCache, OidDumperCache]]
@@ -109,10 +129,6 @@ class Transformer(AdaptContext):
         else:
             return cls(context)
 
-    @property
-    def connection(self) -> Optional["BaseConnection[Any]"]:
-        return self._conn
-
     @property
     def encoding(self) -> str:
         if not self._encoding:
@@ -186,11 +202,34 @@ class Transformer(AdaptContext):
         types = [self._get_none_oid()] * nparams
         pqformats = [TEXT] * nparams
 
+        pdumpers = self._params_dumpers
+        if len(pdumpers) != nparams:
+            pdumpers = self._params_dumpers = [None] * nparams
+
         for i in range(nparams):
             param = params[i]
             if param is None:
                 continue
-            dumper = self.get_dumper(param, formats[i])
+
+            # Reuse the dumper used for the same parameter in the last call,
+            # if the type is the same. Otherwise look it up and remember it.
+            key = type(param)
+            format = formats[i]
+            pdumper = pdumpers[i]
+            if pdumper and pdumper[0] is key and pdumper[1] is format:
+                dumper = pdumper[2]
+                upgradable = pdumper[3]
+            else:
+                dumper = self._get_dumper_by_type(key, format)
+                upgradable = _is_upgradable(dumper)
+                pdumpers[i] = (key, format, dumper, upgradable)
+
+            # Check if the dumper requires an upgrade to handle this value
+            if upgradable:
+                key1 = dumper.get_key(param, format)
+                if key1 is not key:
+                    dumper = self._get_upgraded_dumper(dumper, key1, param, format)
+
             out[i] = dumper.dump(param)
             types[i] = dumper.oid
             pqformats[i] = dumper.format
@@ -208,10 +247,9 @@ class Transformer(AdaptContext):
         # Check the last char because the first one might be 'E'.
         oid = dumper.oid
         if oid and rv and rv[-1] == b"'"[0] and oid != TEXT_OID:
-            try:
-                type_sql = self._oid_types[oid]
-            except KeyError:
-                ti = self.adapters.types.get(oid)
+            type_sql = self._oid_types.get(oid)
+            if type_sql is None:
+                ti = self._adapters.types.get(oid)
                 if ti:
                     if oid < 8192:
                         # builtin: prefer "timestamptz" to "timestamp with time zone"
@@ -238,31 +276,55 @@ class Transformer(AdaptContext):
         # Normally, the type of the object dictates how to dump it
         key = type(obj)
 
+        # Fast path: the same type was dumped in the last call
+        if key is self._last_key and format is self._last_format:
+            dumper = self._last_dumper
+        else:
+            dumper = self._get_dumper_by_type(key, format)
+            self._last_key = key
+            self._last_format = format
+            self._last_dumper = dumper
+
+        # Check if the dumper requires an upgrade to handle this specific value
+        key1 = dumper.get_key(obj, format)
+        if key1 is key:
+            return dumper
+
+        return self._get_upgraded_dumper(dumper, key1, obj, format)
+
+    def _get_dumper_by_type(self, key: type, format: PyFormat) -> abc.Dumper:
+        """
+        Return the Dumper instance to dump objects of type `!key`.
+
+        The dumper returned might need an upgrade to dump a specific object.
+        """
         # Reuse an existing Dumper class for objects of the same type
         cache = self._dumpers[format]
-        try:
-            dumper = cache[key]
-        except KeyError:
+        dumper = cache.get(key)
+        if dumper is None:
             # If it's the first time we see this type, look for a dumper
             # configured for it.
             try:
-                dcls = self.adapters.get_dumper(key, format)
+                dcls = self._adapters.get_dumper(key, format)
             except e.ProgrammingError as ex:
                 raise ex from None
             else:
                 cache[key] = dumper = dcls(key, self)
 
-        # Check if the dumper requires an upgrade to handle this specific value
-        key1 = dumper.get_key(obj, format)
-        if key1 is key:
-            return dumper
+        return dumper
 
-        # If it does, ask the dumper to create its own upgraded version
-        try:
-            return cache[key1]
-        except KeyError:
-            dumper = cache[key1] = dumper.upgrade(obj, format)
-            return dumper
+    def _get_upgraded_dumper(
+        self, dumper: abc.Dumper, key: DumperKey, obj: Any, format: PyFormat
+    ) -> abc.Dumper:
+        """
+        Return the upgrade of `!dumper` to dump `!obj`, with `!key` its get_key().
+        """
+        # Ask the dumper to create its own upgraded version, unless cached.
+        cache = self._dumpers[format]
+        dumper1 = cache.get(key)
+        if dumper1 is None:
+            dumper1 = cache[key] = dumper.upgrade(obj, format)
+        return dumper1
 
     def _get_none_oid(self) -> int:
         try:
@@ -284,14 +346,16 @@ class Transformer(AdaptContext):
         if not self._oid_dumpers:
             self._oid_dumpers = ({}, {})
 
+        if not isinstance(format, int) or format not in (0, 1):
+            raise ValueError(f"format should be a psycopg.pq.Format, not {format!r}")
+
         # Reuse an existing Dumper class for objects of the same type
         cache = self._oid_dumpers[format]
-        try:
-            return cache[oid]
-        except KeyError:
+        dumper = cache.get(oid)
+        if dumper is None:
             # If it's the first time we see this type, look for a dumper
             # configured for it.
-            dcls = self.adapters.get_dumper_by_oid(oid, format)
+            dcls = self._adapters.get_dumper_by_oid(oid, format)
             cache[oid] = dumper = dcls(NoneType, self)
 
         return dumper
@@ -306,13 +370,18 @@ class Transformer(AdaptContext):
                 f"rows must be included between 0 and {self._ntuples}"
             )
 
+        # Use local names in the loops to avoid attributes lookups
+        get_value = res.get_value
+        loaders = self._row_loaders
+        nfields = self._nfields
+
         records = []
         for row in range(row0, row1):
-            record: List[Any] = [None] * self._nfields
-            for col in range(self._nfields):
-                val = res.get_value(row, col)
+            record: List[Any] = [None] * nfields
+            for col in range(nfields):
+                val = get_value(row, col)
                 if val is not None:
-                    record[col] = self._row_loaders[col](val)
+                    record[col] = loaders[col](val)
             records.append(make_row(record))
 
         return records
@@ -325,36 +394,68 @@ class Transformer(AdaptContext):
         if not 0 <= row < self._ntuples:
             return None
 
-        record: List[Any] = [None] * self._nfields
-        for col in range(self._nfields):
-            val = res.get_value(row, col)
+        get_value = res.get_value
+        loaders = self._row_loaders
+        nfields = self._nfields
+
+        record: List[Any] = [None] * nfields
+        for col in range(nfields):
+            val = get_value(row, col)
             if val is not None:
-                record[col] = self._row_loaders[col](val)
+                record[col] = loaders[col](val)
 
         return make_row(record)
 
     def load_sequence(self, record: Sequence[Optional[Buffer]]) -> Tuple[Any, ...]:
-        if len(self._row_loaders) != len(record):
+        loaders = self._row_loaders
+        if len(loaders) != len(record):
             raise e.ProgrammingError(
                 f"cannot load sequence of {len(record)} items:"
-                f" {len(self._row_loaders)} loaders registered"
+                f" {len(loaders)} loaders registered"
             )
 
+        # Build a list rather than consuming a generator: it's faster.
         return tuple(
-            (self._row_loaders[i](val) if val is not None else None)
-            for i, val in enumerate(record)
+            [
+                (load(val) if val is not None else None)
+                for load, val in zip(loaders, record)
+            ]
         )
 
     def get_loader(self, oid: int, format: pq.Format) -> abc.Loader:
-        try:
-            return self._loaders[format][oid]
-        except KeyError:
-            pass
+        if not isinstance(format, int) or format not in (0, 1):
+            raise ValueError(f"format should be a psycopg.pq.Format, not {format!r}")
+        cache = self._loaders[format]
+
+        loader = cache.get(oid)
+        if loader is not None:
+            return loader
 
         loader_cls = self._adapters.get_loader(oid, format)
         if not loader_cls:
             loader_cls = self._adapters.get_loader(INVALID_OID, format)
             if not loader_cls:
                 raise e.InterfaceError("unknown oid loader not found")
-        loader = self._loaders[format][oid] = loader_cls(oid, self)
+        loader = cache[oid] = loader_cls(oid, self)
         return loader
+
+
+# The base Dumper.get_key(), bound on first use, as psycopg.adapt imports
+# this module.
+_base_get_key: Any = None
+
+
+def _is_upgradable(dumper: abc.Dumper) -> bool:
+    """
+    Return `!False` if `!dumper` can dump every object of its class.
+
+    This is the case if it doesn't override the base `!get_key()`, which
+    returns the class of the dumper, so there is no need to call it.
+    """
+    global _base_get_key
+    if _base_get_key is None:
+        from .adapt import Dumper
+
+        _base_get_key = Dumper.get_key
+
+    return type(dumper).get_key is not _base_get_key
@@ -76,6 +76,11 @@ class AdaptContext(Protocol):
 
     """
 
+    # Allow implementations to have no instance __dict__. Hidden to mypy,
+    # which would otherwise require __slots__ in the objects implementing it.
+    if not TYPE_CHECKING:
+        __slots__ = ()
+
     @property
     def adapters(self) -> "AdaptersMap":
         """The adapters configuration that this object uses."""
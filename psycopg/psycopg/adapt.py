@@ -36,7 +36,7 @@ class Dumper(abc.Dumper, ABC):
     def __init__(self, cls: type, context: Optional[abc.AdaptContext] = None):
         self.cls = cls
         self.connection: Optional["BaseConnection[Any]"] = (
-            context.connection if context else None
+            context.connection if context is not None else None
         )
 
     def __repr__(self) -> str:
@@ -127,7 +127,7 @@ class Loader(abc.Loader, ABC):
     def __init__(self, oid: int, context: Optional[abc.AdaptContext] = None):
         self.oid = oid
         self.connection: Optional["BaseConnection[Any]"] = (
-            context.connection if context else None
+            context.connection if context is not None else None
         )
 
     @abstractmethod
@@ -49,14 +49,15 @@ ACTIVE = pq.TransactionStatus.ACTIVE
 class BaseCursor(Generic[ConnectionType, Row]):
     __slots__ = """
         _conn format _adapters arraysize _closed _results pgresult _pos
-        _iresult _rowcount _query _tx _last_query _row_factory _make_row
-        _pgconn _execmany_returning
+        _iresult _rowcount _query _tx _tx_generation _last_query _row_factory
+        _make_row _pgconn _execmany_returning
         __weakref__
         """.split()
 
     ExecStatus = pq.ExecStatus
 
     _tx: "Transformer"
+    _tx_generation: int
     _make_row: RowMaker[Row]
     _pgconn: "PGconn"
 
@@ -369,9 +370,16 @@ class BaseCursor(Generic[ConnectionType, Row]):
             raise e.InterfaceError("the cursor is closed")
 
         self._reset()
-        if not self._last_query or (self._last_query is not query):
+        # Don't reuse the transformer if adapters were registered meanwhile:
+        # it may have cached the previous ones.
+        if (
+            not self._last_query
+            or (self._last_query is not query)
+            or self._tx_generation != self._adapters._generation
+        ):
             self._last_query = None
             self._tx = adapt.Transformer(self)
+            self._tx_generation = self._adapters._generation
         yield from self._conn._start_query()
 
     def _start_copy_gen(
@@ -851,12 +851,13 @@ class PGresult:
         return impl.PQbinaryTuples(self._pgresult_ptr)
 
     def get_value(self, row_number: int, column_number: int) -> Optional[bytes]:
-        length: int = impl.PQgetlength(self._pgresult_ptr, row_number, column_number)
+        res = self._pgresult_ptr
+        length: int = impl.PQgetlength(res, row_number, column_number)
         if length:
-            v = impl.PQgetvalue(self._pgresult_ptr, row_number, column_number)
+            v = impl.PQgetvalue(res, row_number, column_number)
             return string_at(v, length)
         else:
-            if impl.PQgetisnull(self._pgresult_ptr, row_number, column_number):
+            if impl.PQgetisnull(res, row_number, column_number):
                 return None
             else:
                 return b""
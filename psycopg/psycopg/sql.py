@@ -4,7 +4,6 @@ SQL composition utility module
 
 # Copyright (C) 2020 The Psycopg Team
 
-import codecs
 import string
 from abc import ABC, abstractmethod
 from typing import Any, Iterator, Iterable, List, Optional, Sequence, Union
@@ -80,11 +79,8 @@ class Composable(ABC):
         conn = context.connection if context else None
         enc = conn_encoding(conn)
         b = self.as_bytes(context)
-        if isinstance(b, bytes):
-            return b.decode(enc)
-        else:
-            # buffer object
-            return codecs.lookup(enc).decode(b)[0]
+        # str() decodes bytes as well as other buffer objects
+        return str(b, enc)
 
     def __add__(self, other: "Composable") -> "Composed":
         if isinstance(other, Composed):
@@ -6,18 +6,21 @@ Adapters for arrays
 
 import re
 import struct
-from typing import Any, cast, Callable, List, Optional, Pattern, Set, Tuple, Type
+from itertools import chain, repeat
+from typing import Any, cast, Callable, Dict, List, Optional, Pattern, Set, Tuple
+from typing import Type
 
 from .. import pq
 from .. import errors as e
 from .. import postgres
 from ..abc import AdaptContext, Buffer, Dumper, DumperKey, NoneType, Loader, Transformer
-from ..adapt import RecursiveDumper, RecursiveLoader, PyFormat
+from ..adapt import RecursiveDumper, RecursiveLoader, PyFormat, AdaptersMap
 from .._oids import TEXT_OID, INVALID_OID, TEXT_ARRAY_OID
 from .._compat import cache, prod
 from .._struct import pack_len, unpack_len
 from .._cmodule import _psycopg
 from .._typeinfo import TypeInfo
+from . import numeric
 
 _struct_head = struct.Struct("!III")  # ndims, hasnull, elem oid
 _pack_head = cast(Callable[[int, int, int], bytes], _struct_head.pack)
@@ -30,6 +33,33 @@ PY_TEXT = PyFormat.TEXT
 PQ_BINARY = pq.Format.BINARY
 
 
+def _get_items_structs() -> Dict[type, Tuple[str, int]]:
+    """
+    Return the binary dumpers of fixed-size numbers, with the struct codes of
+    an item (length and value) and the length of the value.
+
+    Lists of these numbers can be dumped by a single pack() call rather than
+    calling the dumper for each item.
+    """
+    rv: Dict[type, Tuple[str, int]] = {}
+    codes: List[Tuple[type, str]] = [
+        (numeric.Int2BinaryDumper, "h"),
+        (numeric.Int4BinaryDumper, "i"),
+        (numeric.Int8BinaryDumper, "q"),
+        (numeric.OidBinaryDumper, "I"),
+        (numeric.Float4BinaryDumper, "f"),
+        (numeric.FloatBinaryDumper, "d"),
+    ]
+    for cls, code in codes:
+        item = ("i" + code, struct.calcsize("!" + code))
+        rv[cls] = rv[AdaptersMap._get_optimised(cls)] = item
+
+    return rv
+
+
+_items_structs = _get_items_structs()
+
+
 class BaseListDumper(RecursiveDumper):
     element_oid = INVALID_OID
 
@@ -251,6 +281,7 @@ class ListBinaryDumper(BaseListDumper):
         data: List[Buffer] = [b"", b""]  # placeholders to avoid a resize
         dims: List[int] = []
         hasnull = 0
+        items_struct = _items_structs.get(type(self.sub_dumper))
 
         def calc_dims(L: List[Any]) -> None:
             if isinstance(L, self.cls):
@@ -267,6 +298,15 @@ class ListBinaryDumper(BaseListDumper):
                 raise e.DataError("nested lists have inconsistent lengths")
 
             if dim == len(dims) - 1:
+                if items_struct and None not in L:
+                    try:
+                        data.append(_pack_items(items_struct, L))
+                        return
+                    except (struct.error, OverflowError):
+                        # Let the dumper deal with the value: it might convert
+                        # it (e.g. the C float4 dumper dumps inf) or raise.
+                        pass
+
                 for item in L:
                     if item is not None:
                         # If we get here, the sub_dumper must have been set
@@ -289,6 +329,14 @@ class ListBinaryDumper(BaseListDumper):
         return b"".join(data)
 
 
+def _pack_items(items_struct: Tuple[str, int], L: List[Any]) -> bytes:
+    """
+    Pack a list of not null numbers as length, value pairs in binary format.
+    """
+    code, size = items_struct
+    return struct.pack("!" + code * len(L), *chain.from_iterable(zip(repeat(size), L)))
+
+
 class ArrayLoader(RecursiveLoader):
     delimiter = b","
     base_oid: int
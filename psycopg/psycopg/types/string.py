@@ -110,9 +110,8 @@ class TextLoader(Loader):
 
     def load(self, data: Buffer) -> Union[bytes, str]:
         if self._encoding:
-            if isinstance(data, memoryview):
-                data = bytes(data)
-            return data.decode(self._encoding)
+            # str() decodes any buffer: no copy of memoryviews to bytes needed
+            return str(data, self._encoding)
         else:
             # return bytes for SQL_ASCII db
             if not isinstance(data, bytes):
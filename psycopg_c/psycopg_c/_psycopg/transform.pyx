@@ -15,6 +15,7 @@ from cpython.dict cimport PyDict_GetItem, PyDict_SetItem
 from cpython.list cimport (
     PyList_New, PyList_CheckExact,
     PyList_GET_ITEM, PyList_SET_ITEM, PyList_GET_SIZE)
+from cpython.long cimport PyLong_Check, PyLong_AsLongAndOverflow
 from cpython.bytes cimport PyBytes_AS_STRING
 from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
 from cpython.object cimport PyObject, PyObject_CallFunctionObjArgs
@@ -44,6 +45,16 @@ ctypedef struct pg_result_int:
     # ...more members, which we ignore
 
 
+cdef int _as_pq_format(object fmt):
+    """Return 0 or 1 for a valid pq.Format value, -1 otherwise."""
+    cdef int overflow
+    cdef long rv
+    if not PyLong_Check(fmt):
+        return -1
+    rv = PyLong_AsLongAndOverflow(fmt, &overflow)
+    return rv if rv == 0 or rv == 1 else -1
+
+
 @cython.freelist(16)
 cdef class RowLoader:
     cdef CLoader cloader
@@ -259,9 +270,20 @@ cdef class Transformer:
         # Normally, the type of the object dictates how to dump it
         key = type(<object>obj)
 
-        # Establish where would the dumper be cached
-        bfmt = PyUnicode_AsUTF8String(<object>fmt)
-        cdef char cfmt = PyBytes_AS_STRING(bfmt)[0]
+        # Establish where would the dumper be cached. Compare the format with
+        # the PyFormat members by identity first, in order to avoid converting
+        # it to a temporary bytes object for every value dumped.
+        cdef char cfmt
+        if fmt == <PyObject *>PG_AUTO:
+            cfmt = b's'
+        elif fmt == <PyObject *>PG_BINARY:
+            cfmt = b'b'
+        elif fmt == <PyObject *>PG_TEXT:
+            cfmt = b't'
+        else:
+            bfmt = PyUnicode_AsUTF8String(<object>fmt)
+            cfmt = PyBytes_AS_STRING(bfmt)[0]
+
         if cfmt == b's':
             if self._auto_dumpers is None:
                 self._auto_dumpers = {}
@@ -323,7 +345,7 @@ cdef class Transformer:
         cdef RowDumper row_dumper
 
         # Establish where would the dumper be cached
-        cdef int cfmt = <object>fmt
+        cdef int cfmt = _as_pq_format(<object>fmt)
         if cfmt == 0:
             if self._oid_text_dumpers is None:
                 self._oid_text_dumpers = {}
@@ -584,17 +606,18 @@ cdef class Transformer:
         cdef PyObject *ptr
         cdef PyObject *cache
 
-        if <object>fmt == PQ_TEXT:
+        cdef int cfmt = _as_pq_format(<object>fmt)
+        if cfmt == 0:
             if self._text_loaders is None:
                 self._text_loaders = {}
             cache = <PyObject *>self._text_loaders
-        elif <object>fmt == PQ_BINARY:
+        elif cfmt == 1:
             if self._binary_loaders is None:
                 self._binary_loaders = {}
             cache = <PyObject *>self._binary_loaders
         else:
             raise ValueError(
-                f"format should be a psycopg.pq.Format, not {format}")
+                f"format should be a psycopg.pq.Format, not {<object>fmt}")
 
         ptr = PyDict_GetItem(<object>cache, <object>oid)
         if ptr != NULL:
@@ -9,6 +9,7 @@ def global_adapters():
     from psycopg import adapters
 
     dumpers = deepcopy(adapters._dumpers)
+    dumpers_mro = deepcopy(adapters._dumpers_mro)
     dumpers_by_oid = deepcopy(adapters._dumpers_by_oid)
     loaders = deepcopy(adapters._loaders)
     types = list(adapters.types)
@@ -16,6 +17,7 @@ def global_adapters():
     yield None
 
     adapters._dumpers = dumpers
+    adapters._dumpers_mro = dumpers_mro
     adapters._dumpers_by_oid = dumpers_by_oid
     adapters._loaders = loaders
     adapters.types.clear()
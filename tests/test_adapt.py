@@ -1,3 +1,4 @@
+import weakref
 import datetime as dt
 from types import ModuleType
 from typing import Any, List
@@ -7,11 +8,13 @@ import pytest
 import psycopg
 from psycopg import pq, sql, postgres
 from psycopg import errors as e
-from psycopg.adapt import Transformer, PyFormat, Dumper, Loader
+from psycopg.adapt import AdaptersMap, Transformer, PyFormat, Dumper, Loader
 from psycopg._cmodule import _psycopg
 from psycopg.postgres import types as builtins
 from psycopg.types.array import ListDumper, ListBinaryDumper
 
+from .utils import gc_collect
+
 
 @pytest.mark.parametrize(
     "data, format, result, type",
@@ -31,6 +34,61 @@ def test_dump(data, format, result, type):
         assert dumper.oid == builtins[type].oid
 
 
+@pytest.mark.parametrize("fmt", PyFormat)
+def test_dump_alternate_types(fmt):
+    t = Transformer()
+    for data in [1, "hello", 1, 1, 10**10, "world", b"x", 1.5, 2**100, 1]:
+        dumper = t.get_dumper(data, fmt)
+        ref = Transformer().get_dumper(data, fmt)
+        assert type(dumper) is type(ref)
+        assert dumper.oid == ref.oid
+        assert dumper.dump(data) == ref.dump(data)
+
+
+def test_transformer_slots():
+    t = Transformer()
+    assert not hasattr(t, "__dict__")
+    with pytest.raises(AttributeError):
+        t.foo = 1  # type: ignore[attr-defined]
+
+
+def test_adapters_multiple_inheritance():
+    class DumperLoader(Dumper, Loader):
+        def dump(self, obj):
+            return obj
+
+        def load(self, data):
+            return data
+
+    class WithSlots:
+        __slots__ = ("foo",)
+
+    class SlotsDumper(make_dumper("x"), WithSlots):  # type: ignore[misc]
+        pass
+
+    assert SlotsDumper(str).dump("a") == b"ax"
+
+
+@pytest.mark.parametrize("fmt", PyFormat)
+def test_dump_sequence_types_change(fmt):
+    t = Transformer()
+    seqs: List[List[Any]] = [
+        [1, "hello", 1.5],
+        [10**10, "world", 2.5],
+        ["hello", 1, None],
+        [None, 2**100, b"x"],
+        [1, "hello", 1.5],
+        [["a"], [1], [2**40]],
+        [[2**40], ["a"], [1]],
+    ]
+    for params in seqs:
+        formats = [fmt] * len(params)
+        ref = Transformer()
+        assert t.dump_sequence(params, formats) == ref.dump_sequence(params, formats)
+        assert t.types == ref.types
+        assert t.formats == ref.formats
+
+
 @pytest.mark.parametrize(
     "data, result",
     [
@@ -111,6 +169,29 @@ def test_dump_cursor_ctx(conn):
     assert cur.fetchone() == ("hellob",)
 
 
+def test_dump_cursor_ctx_same_query(conn):
+    cur = conn.cursor()
+    query = "select %s"
+    cur.execute(query, [MyStr("hello")])
+    assert cur.fetchone() == ("hello",)
+
+    # The cursor must not reuse the dumpers cached for the previous execution
+    cur.adapters.register_dumper(MyStr, make_dumper("tc"))
+    cur.execute(query, [MyStr("hello")])
+    assert cur.fetchone() == ("hellotc",)
+
+
+def test_register_generation():
+    adapters = AdaptersMap(postgres.adapters)
+    gen = adapters._generation
+    adapters.register_dumper(MyStr, make_dumper("x"))
+    assert adapters._generation > gen
+
+    gen = adapters._generation
+    adapters.register_loader("text", make_loader("x"))
+    assert adapters._generation > gen
+
+
 def test_dump_subclass(conn):
     class MyString(str):
         pass
@@ -181,6 +262,38 @@ def test_cast(data, format, type, result):
     assert rv == result
 
 
+@pytest.mark.parametrize("format", [0, 1, pq.Format.TEXT, pq.Format.BINARY])
+def test_cast_int_format(format):
+    t = Transformer()
+    rv = t.get_loader(builtins["text"].oid, format).load(b"hello")
+    assert rv == "hello"
+
+
+@pytest.mark.parametrize("format", [2, -1, 2**100, 1.0, "t", None])
+def test_bad_format(format):
+    t = Transformer()
+    with pytest.raises(ValueError):
+        t.get_loader(builtins["text"].oid, format)
+    with pytest.raises(ValueError):
+        t.set_dumper_types([builtins["text"].oid], format)
+    with pytest.raises(ValueError):
+        postgres.adapters.get_loader(builtins["text"].oid, format)
+    with pytest.raises(ValueError):
+        postgres.adapters.get_dumper_by_oid(builtins["text"].oid, format)
+
+
+def test_register_bad_args():
+    adapters = AdaptersMap(postgres.adapters)
+    with pytest.raises(TypeError):
+        adapters.register_dumper(1, make_dumper("x"))  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        adapters.register_loader(25.0, make_loader("x"))  # type: ignore[arg-type]
+
+    loader = make_loader("x")
+    adapters.register_loader("text", loader)
+    assert adapters.get_loader(builtins["text"].oid, pq.Format.TEXT) is loader
+
+
 def test_register_loader_by_oid(conn):
     oid = builtins["text"].oid
     assert oid == 25
@@ -272,6 +385,39 @@ def test_cow_loaders(conn):
     assert cur2.execute("select 'hello2'::text").fetchone() == ("hello2c2",)
 
 
+def test_cow_dumpers_subclass():
+    parent = AdaptersMap(postgres.adapters)
+    sdumper = parent.get_dumper(str, PyFormat.TEXT)
+    assert parent.get_dumper(MyStr, PyFormat.TEXT) is sdumper
+
+    child = AdaptersMap(parent)
+    assert child.get_dumper(MyStr, PyFormat.TEXT) is sdumper
+
+    dumper = make_dumper("c")
+    child.register_dumper(str, dumper)
+    assert child.get_dumper(MyStr, PyFormat.TEXT) is dumper
+    assert child.get_dumper(MyStr, PyFormat.AUTO) is dumper
+    assert parent.get_dumper(MyStr, PyFormat.TEXT) is sdumper
+
+    dumper = make_dumper("p")
+    parent.register_dumper(str, dumper)
+    assert parent.get_dumper(MyStr, PyFormat.TEXT) is dumper
+    assert child.get_dumper(MyStr, PyFormat.TEXT) is not dumper
+
+
+def test_dumpers_subclass_no_leak():
+    def dump_new_class() -> "weakref.ref[type]":
+        class DynStr(str):
+            pass
+
+        Transformer().dump_sequence([DynStr("x")], [PyFormat.AUTO])
+        return weakref.ref(DynStr)
+
+    refs = [dump_new_class() for i in range(10)]
+    gc_collect()
+    assert all(r() is None for r in refs)
+
+
 @pytest.mark.parametrize(
     "sql, obj",
     [("'{hello}'::text[]", ["helloc"]), ("row('hello'::text)", ("helloc",))],
@@ -318,6 +318,17 @@ class TestLiteral:
         assert sql.Literal(42).as_string(conn) == "42"
         assert sql.Literal(dt.date(2017, 1, 1)).as_string(conn) == "'2017-01-01'::date"
 
+    def test_as_string_no_conn(self):
+        assert sql.Literal(eur).as_string(None) == f"'{eur}'"
+
+    @pytest.mark.parametrize("pytype", [bytes, bytearray, memoryview])
+    def test_as_string_buffer(self, pytype):
+        class BufferLiteral(sql.Literal):
+            def as_bytes(self, context):
+                return pytype(super().as_bytes(context))
+
+        assert BufferLiteral(eur).as_string(None) == f"'{eur}'"
+
     def test_as_bytes(self, conn):
         assert sql.Literal(None).as_bytes(conn) == b"NULL"
         assert no_e(sql.Literal("foo").as_bytes(conn)) == b"'foo'"
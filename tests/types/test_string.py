@@ -4,7 +4,8 @@ import psycopg
 from psycopg import pq
 from psycopg import sql
 from psycopg import errors as e
-from psycopg.adapt import PyFormat
+from psycopg.adapt import PyFormat, Transformer
+from psycopg.postgres import types as builtins
 from psycopg import Binary
 
 from ..utils import eur
@@ -218,6 +219,16 @@ def test_load_ascii(conn, typename, fmt_out):
     assert res == eur.encode()
 
 
+@pytest.mark.parametrize("fmt_out", pq.Format)
+@pytest.mark.parametrize("pytype", [bytes, bytearray, memoryview])
+def test_load_buffer(fmt_out, pytype):
+    tx = Transformer()
+    loader = tx.get_loader(builtins["text"].oid, fmt_out)
+    rv = loader.load(pytype(eur.encode()))
+    assert rv == eur
+    assert type(rv) is str
+
+
 @pytest.mark.parametrize("fmt_in", PyFormat)
 @pytest.mark.parametrize("fmt_out", pq.Format)
 @pytest.mark.parametrize("typename", ["text", "varchar", "name", crdb_bpchar("bpchar")])